@@ -1,22 +1,56 @@
 import streamlit as st
-from openai import OpenAI
+from openai import OpenAI, DefaultHttpxClient
+import httpx
+import ahocorasick
 import pandas as pd
 import os
+import io
+import hashlib
+import stat as stat_module
+import tempfile
+import re
+import string
+import textwrap
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # --- 0. 상수 및 파일 경로 정의 ---
 GLOSSARY_FILE = "glossary.csv"
 STYLE_GUIDE_FILE = "style_guide.txt"
 NOTEPAD_FILE = "notepad.txt"
+# 배포별 설정 (환경 변수로 덮어쓸 수 있음)
+CONFIG = {
+    "title": os.environ.get("TRANSLATOR_TITLE", "자유공산주의전선 번역기"),
+    "model_name": os.environ.get("TRANSLATOR_MODEL", "gpt-4.1-mini"),
+    "has_notepad": os.environ.get("TRANSLATOR_NOTEPAD", "1") != "0",
+    "en_col": os.environ.get("TRANSLATOR_EN_COLUMN", "영어"),
+    "ko_col": os.environ.get("TRANSLATOR_KO_COLUMN", "한글"),
+}
+EN_COL, KO_COL = CONFIG["en_col"], CONFIG["ko_col"]  # 단어장 CSV의 원어/번역어 열 이름
+# 단어장 열은 Arrow 기반 문자열로 읽음 (빈 단어장도 null 타입이 아닌 문자열 열이 되도록 명시)
+GLOSSARY_DTYPES = {EN_COL: pd.StringDtype(storage="pyarrow"), KO_COL: pd.StringDtype(storage="pyarrow")}
+MAX_PARALLEL_REQUESTS = 8  # 여러 문단을 동시에 번역할 때의 최대 동시 요청 수
+TRANSLATION_CACHE_SIZE = 256  # 최근 번역 결과를 보관할 최대 개수
 
 # --- 1. 설정 및 초기화 ---
 
 # 페이지 제목 설정
 st.set_page_config(page_title="조직 번역기", page_icon="🌐", layout="wide")
-st.title("🌐 자유공산주의전선 번역기")
+st.title(f"🌐 {CONFIG['title']}")
+
+# OpenAI 클라이언트 (rerun과 세션 사이에 하나의 연결 풀을 공유해 TLS 연결 재사용)
+@st.cache_resource
+def get_client() -> OpenAI:
+    return OpenAI(
+        api_key=st.secrets["openai"]["api_key"],
+        # SDK 기본 HTTP 설정(리다이렉트, 타임아웃 등)은 유지하고 HTTP/2와 연결 풀 크기만 조정
+        http_client=DefaultHttpxClient(http2=True, limits=httpx.Limits(max_keepalive_connections=MAX_PARALLEL_REQUESTS)),
+    )
 
 # OpenAI 클라이언트 초기화 (st.secrets 사용으로 보안 강화)
 try:
-    client = OpenAI(api_key=st.secrets["openai"]["api_key"])
+    client = get_client()
 except Exception:
     st.error("🚨 OpenAI API 키를 설정해주세요! `.streamlit/secrets.toml` 파일이 필요합니다.")
     st.stop()
@@ -24,106 +58,289 @@ except Exception:
 
 # --- 2. 헬퍼 함수 (단어장 및 스타일 가이드) ---
 
-# 단어장 로드
+# 파일 읽기 캐시: {경로: ((수정 시각, 크기), 내용, 파일 해시)}
+# 저장 직후처럼 해시만 알고 아직 읽어서 파싱하지 않은 항목은 내용 자리에 None을 둠
+# (rerun마다 새로 만들어지는 sentinel 객체 대신 None을 써야 캐시와 함께 rerun을 넘어 유지됨)
+# 스크립트는 매 rerun마다 다시 실행되므로 st.cache_resource로 프로세스 전체에서 하나의 dict를 공유
+@st.cache_resource
+def _file_cache() -> dict:
+    return {}
+
+def _file_version(path: str):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+# 수정 시각이 그대로면 디스크를 다시 읽지 않고 캐시된 내용을 반환 (파일이 없으면 None)
+def _read_cached(path: str, parse=lambda data: data.decode("utf-8-sig")):
+    version = _file_version(path)
+    if version is None:
+        return None
+    cache = _file_cache()
+    cached = cache.get(path)
+    if cached and cached[0] == version and cached[1] is not None:
+        return cached[1]
+    with open(path, "rb") as f:
+        data = f.read()
+    value = parse(data)
+    cache[path] = (version, value, hashlib.blake2b(data).digest())
+    return value
+
+# 새로 만드는 파일의 기본 권한 (umask 적용, 프로세스당 한 번만 계산)
+@st.cache_resource
+def _default_file_mode() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+# 내용이 바뀐 경우에만 임시 파일에 쓴 뒤 교체 (저장 도중 오류가 나도 기존 파일이 깨지지 않음)
+def _write_if_changed(path: str, data: bytes):
+    cached = _file_cache().get(path)
+    digest = hashlib.blake2b(data).digest()
+    if cached and cached[0] == _file_version(path) and cached[2] == digest:
+        return
+    # 세션마다 고유한 임시 파일을 써서 동시 저장이 서로의 임시 파일을 덮어쓰지 않게 함
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            # 교체 후 다른 세션이 다시 덮어썼을 수 있으므로 버전은 교체 전에 우리 파일에서 읽어 둠
+            stat = os.fstat(f.fileno())
+        # mkstemp는 0600으로 만들므로 기존 파일의 권한(없으면 umask 기준 기본값)을 그대로 적용
+        try:
+            mode = stat_module.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = _default_file_mode()
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    # 다음 저장에서 같은 내용이면 건너뛸 수 있도록 새 파일의 해시를 기록
+    _file_cache()[path] = ((stat.st_mtime_ns, stat.st_size), None, digest)
+
+def _parse_glossary(data: bytes) -> pd.DataFrame:
+    return pd.read_csv(io.BytesIO(data), engine="pyarrow", dtype_backend="pyarrow", dtype=GLOSSARY_DTYPES)
+
+# 단어장 로드 (반환된 DataFrame은 세션 간에 공유되므로 직접 수정하지 않음)
 def load_glossary():
     if not os.path.exists(GLOSSARY_FILE):
         # 파일이 없으면 기본 헤더로 생성
-        pd.DataFrame(columns=["영어", "한글"]).to_csv(GLOSSARY_FILE, index=False, encoding='utf-8-sig')
-    return pd.read_csv(GLOSSARY_FILE)
+        save_glossary(pd.DataFrame(columns=[EN_COL, KO_COL]))
+    return _read_cached(GLOSSARY_FILE, _parse_glossary)
 
 # 단어장 저장
 def save_glossary(df):
-    df.to_csv(GLOSSARY_FILE, index=False, encoding='utf-8-sig')
+    _write_if_changed(GLOSSARY_FILE, df.to_csv(index=False).encode('utf-8-sig'))
 
 # 스타일 가이드 로드
 def load_style_guide():
-    if not os.path.exists(STYLE_GUIDE_FILE):
+    style_text = _read_cached(STYLE_GUIDE_FILE)
+    if style_text is None:
         # 파일이 없으면 기본 내용으로 생성
-        default_style = "번역 스타일: 공식적이고 전문적인 톤을 유지하며, 문장은 명확하고 간결하게 작성합니다. 모든 번역은 존댓말을 사용합니다."
-        with open(STYLE_GUIDE_FILE, "w", encoding="utf-8") as f:
-            f.write(default_style)
-    with open(STYLE_GUIDE_FILE, "r", encoding="utf-8") as f:
-        return f.read()
+        style_text = "번역 스타일: 공식적이고 전문적인 톤을 유지하며, 문장은 명확하고 간결하게 작성합니다. 모든 번역은 존댓말을 사용합니다."
+        save_style_guide(style_text)
+    return style_text
 
 # 스타일 가이드 저장
 def save_style_guide(style_text):
-    with open(STYLE_GUIDE_FILE, "w", encoding="utf-8") as f:
-        f.write(style_text)
+    _write_if_changed(STYLE_GUIDE_FILE, style_text.encode("utf-8"))
 
 # 공용 메모장 로드
 def load_notepad():
-    if not os.path.exists(NOTEPAD_FILE):
-        return "" # 파일이 없으면 빈 문자열 반환
-    with open(NOTEPAD_FILE, "r", encoding="utf-8") as f:
-        return f.read()
+    content = _read_cached(NOTEPAD_FILE)
+    return content if content is not None else "" # 파일이 없으면 빈 문자열 반환
 
 # 공용 메모장 저장
 def save_notepad(content):
-    with open(NOTEPAD_FILE, "w", encoding="utf-8") as f:
-        f.write(content)
+    _write_if_changed(NOTEPAD_FILE, content.encode("utf-8"))
+
+# 단어장 검색용 Aho-Corasick 오토마톤 생성 (소문자 영어 단어 -> (단어, "en=>ko" 프롬프트 항목 목록))
+# 대소문자만 다른 단어(Party/party)도 모두 프롬프트에 들어가도록 같은 키의 항목은 목록으로 모음
+# 비어있는 행은 건너뛰도록 안정성 추가 (행 단위 반복 대신 열 단위 벡터 연산 사용)
+def build_glossary_automaton(glossary: pd.DataFrame) -> ahocorasick.Automaton | None:
+    g = glossary.dropna(subset=[EN_COL, KO_COL])
+    english = g[EN_COL].astype(str).str.strip()
+    keys = english.str.lower()
+    non_empty = keys != ""
+    entries = english[non_empty] + "=>" + g[KO_COL].astype(str)[non_empty]
+    grouped = {}
+    for key, entry in zip(keys[non_empty].to_numpy(), entries.to_numpy()):
+        grouped.setdefault(key, []).append(entry)
+    if not grouped:
+        return None
+    automaton = ahocorasick.Automaton()
+    add_word = automaton.add_word
+    for key, key_entries in grouped.items():
+        add_word(key, (key, key_entries))
+    automaton.make_automaton()
+    return automaton
+
+# 입력 문장에 실제로 등장하는 단어만 골라 프롬프트에 포함시킬 형태로 변환 (토큰 절약을 위해 "en=>ko; ..." 한 줄 형식)
+def match_glossary(text: str, automaton: ahocorasick.Automaton | None) -> str:
+    if automaton is None:
+        return ""
+    lowered = text.lower()
+    matched = {}
+    for end, (key, key_entries) in automaton.iter(lowered):
+        start = end - len(key) + 1
+        # 단어 중간에서 시작하는 일치(예: "party" 안의 "art")는 제외 (접미사가 붙은 "states"의 "state"는 허용)
+        if start > 0 and key[0].isalnum() and lowered[start - 1].isalnum():
+            continue
+        matched.update(dict.fromkeys(key_entries))
+    return "; ".join(matched)
+
+# 단어장 갱신 (세션 상태와 검색 오토마톤을 함께 갱신)
+def set_glossary(df):
+    st.session_state.glossary_df = df
+    st.session_state.glossary_automaton = build_glossary_automaton(df)
 
 # --- 3. 핵심 번역 함수 ---
 
-def translate_with_openai(text: str, glossary: pd.DataFrame, style_guide: str) -> str | None:
+# 시스템 프롬프트 템플릿 (모듈 로드 시 한 번만 구성)
+# 고정 부분은 OpenAI 프롬프트 캐시가 적용되도록 항상 맨 앞에 동일하게 위치하고,
+# 자주 바뀌는 스타일 가이드와 단어장은 그 뒤에 붙임
+SYSTEM_PROMPT_TEMPLATE = string.Template(textwrap.dedent("""
+    You are an expert translator. Translate the given English text into natural Korean.
+    Output ONLY the translation, with no extra phrases, explanations, or greetings.
+    Rules:
+    1. Preserve the paragraph structure: output exactly as many paragraphs as the input.
+    2. Follow the style guide given below.
+    3. Always use the glossary translations given below (English=>Korean).
+
+    Style guide:
+    ${style_guide}
+
+    Glossary:
+    ${glossary_text}
+""").strip())
+
+# 빈 줄을 기준으로 문단 분리
+def split_paragraphs(text: str) -> list[str]:
+    return [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+
+# 단일 요청 번역
+def _complete(system_prompt: str, text: str) -> str:
+    response = client.chat.completions.create(
+        model=CONFIG["model_name"],
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": text}
+        ],
+        temperature=0.1,
+    )
+    return response.choices[0].message.content.strip()
+
+# 단일 요청 번역 (토큰이 도착하는 대로 흘려보냄)
+def _stream_completion(system_prompt: str, text: str):
+    stream = client.chat.completions.create(
+        model=CONFIG["model_name"],
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": text}
+        ],
+        temperature=0.1,
+        stream=True,
+    )
+    for chunk in stream:
+        if chunk.choices:
+            yield chunk.choices[0].delta.content or ""
+
+# 여러 문단은 문단별로 동시에 요청하고, 원래 순서대로 완성되는 대로 흘려보냄
+def _stream_paragraphs(system_prompt: str, paragraphs: list[str]):
+    executor = ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_REQUESTS, len(paragraphs)))
+    try:
+        translated = executor.map(lambda p: _complete(system_prompt, p), paragraphs)
+        for i, paragraph in enumerate(translated):
+            yield ("\n\n" if i else "") + paragraph
+    finally:
+        # 한 문단이 실패하거나 스트림이 중단되면 남은 문단은 요청하지 않고 바로 빠져나옴
+        executor.shutdown(wait=False, cancel_futures=True)
+
+# 최근 번역 결과 캐시 (모든 세션이 공유하므로 잠금과 함께 보관)
+@st.cache_resource
+def _translation_cache() -> tuple[OrderedDict, threading.Lock]:
+    return OrderedDict(), threading.Lock()
+
+def _get_cached_translation(key):
+    cache, lock = _translation_cache()
+    with lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    return None
+
+def _put_cached_translation(key, translation: str):
+    cache, lock = _translation_cache()
+    with lock:
+        cache[key] = translation
+        cache.move_to_end(key)
+        while len(cache) > TRANSLATION_CACHE_SIZE:
+            cache.popitem(last=False)
+
+def translate_with_openai(text: str, glossary_automaton: ahocorasick.Automaton | None, style_guide: str, placeholder) -> str | None:
     if not text.strip():
         return ""
 
-    # 단어장을 프롬프트에 포함시킬 형태로 변환
-    # 비어있는 행은 건너뛰도록 안정성 추가
-    glossary_text = "\n".join([f"- {row['영어']}: {row['한글']}" for index, row in glossary.iterrows() if pd.notna(row['영어']) and pd.notna(row['한글'])])
+    glossary_text = match_glossary(text, glossary_automaton)
 
     # 시스템 프롬프트를 동적으로 구성
-    system_prompt = f"""
-You are an expert translator. Your only job is to translate the given English text into natural Korean.
-Your output must be ONLY the translated text itself, without any additional phrases, explanations, or greetings.
-
-Follow these rules strictly:
-1.  **Structure Preservation**: Preserve the original paragraph structure. If the input text has multiple paragraphs (separated by newlines), the translated output MUST also have the same number of paragraphs.
-2.  **Translation Style**: Adhere to the following style guide.
-    --- STYLE GUIDE ---
-    {style_guide}
-    --- END STYLE GUIDE ---
-
-3.  **Glossary**: You MUST use the translations provided in this glossary for the specified terms.
-    --- GLOSSARY ---
-    {glossary_text if glossary_text else "No specific terms provided."}
-    --- END GLOSSARY ---
-"""
-    
+    system_prompt = SYSTEM_PROMPT_TEMPLATE.substitute(
+        style_guide=style_guide.strip(),
+        glossary_text=glossary_text if glossary_text else "None.",
+    )
+
+    # 같은 모델, 프롬프트, 원문으로 이미 번역한 적이 있으면 API를 호출하지 않음
+    # (프롬프트에는 스타일 가이드와 실제로 쓰인 단어장 항목이 모두 들어 있으므로 이것만으로 충분)
+    cache_key = (CONFIG["model_name"], system_prompt, text)
+    cached = _get_cached_translation(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        with st.spinner("AI가 번역 중입니다..."):
-            response = client.chat.completions.create(
-                model="gpt-4.1-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": text}
-                ],
-                temperature=0.1,
-            )
-        return response.choices[0].message.content.strip()
+        paragraphs = split_paragraphs(text)
+        if len(paragraphs) <= 1:
+            chunks = _stream_completion(system_prompt, text)
+        else:
+            chunks = _stream_paragraphs(system_prompt, paragraphs)
+        with placeholder.container(), st.spinner("AI가 번역 중입니다..."):
+            result = st.write_stream(chunks)
+        translation = result.strip()
+        if translation:
+            _put_cached_translation(cache_key, translation)
+        return translation
     except Exception as e:
         st.error(f"번역 중 오류가 발생했습니다: {e}")
         return None
+    finally:
+        # 성공하든 실패하든 스트리밍 중이던 부분 번역은 화면에서 지움
+        placeholder.empty()
 
 # --- 4. 스트림릿 UI 구성 ---
 
 # 세션 상태 초기화
 if 'glossary_df' not in st.session_state:
-    st.session_state.glossary_df = load_glossary()
+    set_glossary(load_glossary())
 if 'style_guide' not in st.session_state:
     st.session_state.style_guide = load_style_guide()
-if 'notepad_content' not in st.session_state:
+if CONFIG["has_notepad"] and 'notepad_content' not in st.session_state:
     st.session_state.notepad_content = load_notepad()
 if 'english_text' not in st.session_state:
     st.session_state.english_text = ""
 if 'korean_translation' not in st.session_state:
     st.session_state.korean_translation = ""
 
-# 사이드바: 단어장 및 스타일 가이드 관리
-with st.sidebar:
-    st.header("⚙️ 조직 공유 문체, 단어")
-
-    # 문체 정의 영역
+# 각 영역은 fragment로 분리해 해당 영역의 위젯을 조작할 때 그 영역만 다시 실행되도록 함
+# 문체 정의 영역
+@st.fragment
+def style_guide_panel():
     with st.expander("✍️ 번역 문체 정의하기", expanded=True):
         edited_style = st.text_area("번역 문체 지정", value=st.session_state.style_guide, height=300, key="style_editor")
         if st.button("번역 문체 저장", key="save_style_guide"):
@@ -131,7 +348,9 @@ with st.sidebar:
             st.session_state.style_guide = edited_style
             st.success("번역 문체가 저장되었습니다!")
 
-    # 단어장 영역
+# 단어장 영역
+@st.fragment
+def glossary_panel():
     with st.expander("📖 공유 단어장", expanded=False):
         edited_df = st.data_editor(
             st.session_state.glossary_df,
@@ -141,9 +360,9 @@ with st.sidebar:
             height=300
         )
         if st.button("단어장 저장", key="save_glossary"):
-            cleaned_df = edited_df.dropna(subset=['영어', '한글'], how='all').copy()
+            cleaned_df = edited_df.dropna(subset=[EN_COL, KO_COL], how='all').copy()
             save_glossary(cleaned_df)
-            st.session_state.glossary_df = cleaned_df
+            set_glossary(cleaned_df)
             st.success("단어장이 저장되었습니다!")
 
         st.divider()
@@ -151,21 +370,21 @@ with st.sidebar:
         uploaded_file = st.file_uploader(
             "단어장 CSV 파일을 업로드하세요.",
             type=['csv'],
-            help="파일은 '영어', '한글' 열(Column)을 포함해야 합니다."
+            help=f"파일은 '{EN_COL}', '{KO_COL}' 열(Column)을 포함해야 합니다."
         )
 
         if uploaded_file is not None:
             try:
-                new_df = pd.read_csv(uploaded_file)
+                new_df = pd.read_csv(uploaded_file, dtype=GLOSSARY_DTYPES)
 
-                if '영어' not in new_df.columns or '한글' not in new_df.columns:
-                    st.error("오류: CSV 파일에 '영어'와 '한글' 열이 모두 필요합니다.")
+                if EN_COL not in new_df.columns or KO_COL not in new_df.columns:
+                    st.error(f"오류: CSV 파일에 '{EN_COL}'와 '{KO_COL}' 열이 모두 필요합니다.")
                 else:
-                    current_df = st.session_state.glossary_df.copy()
-                    existing_words = set(current_df['영어'].str.lower().dropna())
+                    current_df = st.session_state.glossary_df
+                    existing_words = current_df[EN_COL].str.lower().dropna()
 
-                    new_df.dropna(subset=['영어', '한글'], how='any', inplace=True)
-                    unique_new_rows = new_df[~new_df['영어'].str.lower().isin(existing_words)]
+                    new_df.dropna(subset=[EN_COL, KO_COL], how='any', inplace=True)
+                    unique_new_rows = new_df.loc[~new_df[EN_COL].str.lower().isin(existing_words)]
 
                     added_count = len(unique_new_rows)
                     skipped_count = len(new_df) - added_count
@@ -173,7 +392,7 @@ with st.sidebar:
                     if added_count > 0:
                         updated_df = pd.concat([current_df, unique_new_rows], ignore_index=True)
                         save_glossary(updated_df)
-                        st.session_state.glossary_df = updated_df
+                        set_glossary(updated_df)
                         st.success(f"✅ {added_count}개의 새 단어를 추가했습니다. (중복 {skipped_count}개 제외)")
                         st.rerun()
                     else:
@@ -181,7 +400,9 @@ with st.sidebar:
             except Exception as e:
                 st.error(f"파일 처리 중 오류가 발생했습니다: {e}")
 
-    # 메모장 영역
+# 메모장 영역
+@st.fragment
+def notepad_panel():
     with st.expander("📝 공용 메모장", expanded=False):
         edited_notepad = st.text_area(
             "자유롭게 메모를 남겨주세요.",
@@ -195,21 +416,35 @@ with st.sidebar:
             st.session_state.notepad_content = edited_notepad
             st.success("메모가 저장되었습니다!")
 
-# 메인 화면: 번역기
-col1, col2 = st.columns(2)
-
-with col1:
-    st.subheader("📜 원문 (영어)")
-    st.session_state.english_text = st.text_area("번역할 영어 문장을 입력하세요:", value=st.session_state.english_text, height=300, placeholder="Enter English text here...", label_visibility="collapsed")
-
-with col2:
+# 번역 영역
+@st.fragment
+def translation_panel():
     st.subheader("📖 번역 결과 (한국어)")
     if st.button("한글로 번역하기", type="primary", use_container_width=True):
         if st.session_state.english_text:
-            translation_result = translate_with_openai(st.session_state.english_text, st.session_state.glossary_df, st.session_state.style_guide)
+            translation_result = translate_with_openai(st.session_state.english_text, st.session_state.glossary_automaton, st.session_state.style_guide, st.empty())
             if translation_result:
                 st.session_state.korean_translation = translation_result
         else:
             st.warning("번역할 내용을 입력해주세요.")
     
     st.text_area("번역 결과", value=st.session_state.korean_translation, height=300, label_visibility="collapsed")
+
+# 사이드바: 단어장 및 스타일 가이드 관리
+with st.sidebar:
+    st.header("⚙️ 조직 공유 문체, 단어")
+    style_guide_panel()
+    glossary_panel()
+    if CONFIG["has_notepad"]:
+        notepad_panel()
+
+# 메인 화면: 번역기
+col1, col2 = st.columns(2)
+
+with col1:
+    st.subheader("📜 원문 (영어)")
+    # key로 세션 상태에 직접 연결해 번역 영역만 다시 실행될 때도 최신 입력을 읽을 수 있게 함
+    st.text_area("번역할 영어 문장을 입력하세요:", key="english_text", height=300, placeholder="Enter English text here...", label_visibility="collapsed")
+
+with col2:
+    translation_panel()